@@ -0,0 +1,157 @@
+"""
+_kernels.py - Optional Numba-compiled inner loops for correlate_anchors.py
+and validate_dataset.py.
+
+Numba is not in requirements.txt.  If it is installed, HAVE_NUMBA is True and
+the functions below are compiled to parallel machine code on first use (and
+cached to __pycache__ for later runs).  If it isn't, HAVE_NUMBA is False and
+callers fall back to their plain NumPy implementations.
+
+The baseline kernel takes integer day offsets, each row sorted ascending.
+The date scanner takes the raw UTF-8 bytes and offsets of an Arrow string
+array.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+
+    @njit(cache=True)
+    def _lower_bound(arr, value):
+        """Index of the first element of sorted `arr` that is >= value."""
+        n = arr.shape[0]
+        if n == 0:
+            return 0
+        base = 0
+        while n > 1:
+            half = n >> 1
+            # Written as a select rather than an if/else so it compiles
+            # to a conditional move instead of a branch.
+            base = base + half if arr[base + half] < value else base
+            n -= half
+        return base + (1 if arr[base] < value else 0)
+
+    @njit(parallel=True, cache=True)
+    def baseline_counts(samples, lo_bounds, hi_bounds):
+        """
+        Count anchor-window matches for each simulation.
+
+        `samples` is an (n_simulations, n_target) array with each row sorted.
+        Anchor j's window is the half-open range [lo_bounds[j], hi_bounds[j]),
+        precomputed once by the caller.  Returns one match count per row.
+        """
+        n_sims = samples.shape[0]
+        n_anchors = lo_bounds.shape[0]
+        counts = np.zeros(n_sims, dtype=np.int64)
+        for s in prange(n_sims):
+            row = samples[s]
+            total = 0
+            for j in range(n_anchors):
+                total += _lower_bound(row, hi_bounds[j]) - _lower_bound(row, lo_bounds[j])
+            counts[s] = total
+        return counts
+
+    # Status codes returned by iso_date_days().
+    DATE_INVALID = 0
+    DATE_VALID = 1
+    DATE_UNDECIDED = 2
+
+    @njit(cache=True)
+    def _ascii_int(data, start, end):
+        """Value of the ASCII digits in data[start:end], or -1 if any isn't one."""
+        value = 0
+        for j in range(start, end):
+            c = data[j]
+            if c < 48 or c > 57:
+                return -1
+            value = value * 10 + (c - 48)
+        return value
+
+    @njit(cache=True)
+    def _days_from_civil(y, m, d):
+        """Days since 1970-01-01 for a proleptic Gregorian date."""
+        y -= m <= 2
+        era = (y if y >= 0 else y - 399) // 400
+        yoe = y - era * 400
+        doy = (153 * (m + (-3 if m > 2 else 9)) + 2) // 5 + d - 1
+        doe = yoe * 365 + yoe // 4 - yoe // 100 + doy
+        return era * 146097 + doe - 719468
+
+    @njit(cache=True)
+    def iso_date_days(data, offsets):
+        """
+        Validate and convert "%Y-%m-%d" strings without creating datetimes.
+
+        String i is data[offsets[i]:offsets[i + 1]], already stripped.  The
+        accepted forms are strptime's: a 4-digit year, a 1-2 digit month
+        (01-12 or 1-9) and a 1-2 digit day (01-31, 1-9 or " 1"-" 9"), on a
+        real calendar date.  Returns (days, status): days since 1970-01-01,
+        and DATE_VALID / DATE_INVALID per string, or DATE_UNDECIDED for
+        non-ASCII text, a leading "-" and year 0, which the caller leaves to
+        pandas.
+        """
+        n = offsets.shape[0] - 1
+        days = np.zeros(n, dtype=np.int64)
+        status = np.zeros(n, dtype=np.int8)
+        for i in range(n):
+            start = offsets[i]
+            end = offsets[i + 1]
+            # pandas reads a leading "-" as a negative year; leave those to it.
+            undecided = end > start and data[start] == 45
+            for j in range(start, end):
+                if data[j] >= 128:
+                    undecided = True
+                    break
+            if undecided:
+                status[i] = DATE_UNDECIDED
+                continue
+            # Shortest form is "2024-1-5", longest "2024-01-05".
+            if end - start < 8 or end - start > 10 or data[start + 4] != 45:
+                continue
+            year = _ascii_int(data, start, start + 4)
+            if year < 0:
+                continue
+
+            month_end = start + 5
+            while month_end < end and data[month_end] != 45:
+                month_end += 1
+            month_len = month_end - (start + 5)
+            if month_end == end or month_len < 1 or month_len > 2:
+                continue
+            month = _ascii_int(data, start + 5, month_end)
+            if month < 1 or month > 12:
+                continue
+
+            day_start = month_end + 1
+            day_len = end - day_start
+            if day_len == 2 and data[day_start] == 32:
+                day_start += 1  # strptime allows a space-padded day.
+                day_len = 1
+            if day_len < 1 or day_len > 2:
+                continue
+            day = _ascii_int(data, day_start, end)
+            if day < 1:
+                continue
+
+            leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+            if month == 2:
+                month_days = 29 if leap else 28
+            elif month == 4 or month == 6 or month == 9 or month == 11:
+                month_days = 30
+            else:
+                month_days = 31
+            if day > month_days:
+                continue
+            if year == 0:
+                status[i] = DATE_UNDECIDED
+                continue
+            days[i] = _days_from_civil(year, month, day)
+            status[i] = DATE_VALID
+        return days, status
@@ -13,24 +13,48 @@ The settings dict mirrors the YAML structure:
     settings["paths"]["log_dir"]  ->  "logs"
 """
 
+import atexit
+import copy
+import functools
+import json
 import logging
+import logging.handlers
 import os
+import queue
 from pathlib import Path
 
-import yaml
-
 
 # Project root is one level up from this file (src/ -> project root).
-_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+# abspath is a single getcwd() at most, unlike resolve()'s per-component
+# symlink walk; the toolkit doesn't rely on resolving symlinks here.
+_PROJECT_ROOT = Path(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 _DEFAULT_CONFIG = _PROJECT_ROOT / "config" / "settings.yaml"
 _DEFAULT_ENV = _PROJECT_ROOT / ".env"
 
+# Parsed .env files: path -> (mtime_ns, [(key, value), ...]).
+_DOTENV_CACHE = {}
 
-def _load_dotenv(env_path=None):
-    """Parse a .env file into os.environ (simple key=value, no shell expansion)."""
-    path = Path(env_path) if env_path else _DEFAULT_ENV
-    if not path.exists():
-        return
+# Parsed settings are mirrored to a hidden JSON file next to the YAML
+# (config/.settings.yaml.json) so warm starts can skip YAML parsing.
+# Bump this when the sidecar layout changes so old files are ignored.
+_SIDECAR_VERSION = 1
+
+# One Formatter per distinct format string, shared by every handler.
+_FORMATTERS = {}
+
+# Resolved logging config per settings dict: id(settings) -> (settings, resolved).
+# The settings object is kept alongside so a recycled id() can't match.
+_RESOLVED_LOG_CFG = {}
+_RESOLVED_LOG_CFG_MAX = 8
+
+# Background listeners that own the log-file handlers, keyed by file path:
+# path -> (QueueHandler, QueueListener, MemoryHandler).
+_FILE_LISTENERS = {}
+
+
+def _parse_dotenv(path):
+    """Return the (key, value) pairs with non-empty values from a .env file."""
+    pairs = []
     with open(path) as f:
         for line in f:
             line = line.strip()
@@ -41,24 +65,117 @@ def _load_dotenv(env_path=None):
             key, _, value = line.partition("=")
             key = key.strip()
             value = value.strip()
-            # Only set if the variable has a value (don't overwrite real env vars).
-            if value and key not in os.environ:
-                os.environ[key] = value
+            # Only keep variables that have a value.
+            if value:
+                pairs.append((key, value))
+    return pairs
+
+
+def _load_dotenv(env_path=None):
+    """Parse a .env file into os.environ (simple key=value, no shell expansion)."""
+    path = Path(env_path) if env_path else _DEFAULT_ENV
+    try:
+        mtime = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return
+
+    # Re-parse only when the file has changed since it was last read.
+    cached = _DOTENV_CACHE.get(path)
+    if cached is None or cached[0] != mtime:
+        cached = (mtime, _parse_dotenv(path))
+        _DOTENV_CACHE[path] = cached
+
+    for key, value in cached[1]:
+        # Don't overwrite real env vars.
+        if key not in os.environ:
+            os.environ[key] = value
+
+
+def _sidecar_path(path):
+    """Path of the JSON sidecar for a YAML config file."""
+    return path.with_name(f".{path.name}.json")
+
+
+def _read_sidecar(path, mtime_ns, size):
+    """Return settings from the JSON sidecar, or None if it is missing or stale."""
+    try:
+        with open(_sidecar_path(path)) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("version") != _SIDECAR_VERSION:
+        return None
+    if cached.get("source") != [mtime_ns, size]:
+        return None
+    return cached.get("settings")
+
+
+def _write_sidecar(path, mtime_ns, size, settings):
+    """Best-effort write of the JSON sidecar; failures only cost a re-parse."""
+    # Only cache settings that survive a JSON round trip unchanged
+    # (YAML dates or non-string keys would not).
+    try:
+        if json.loads(json.dumps(settings)) != settings:
+            return
+    except (TypeError, ValueError):
+        return
+
+    sidecar = _sidecar_path(path)
+    tmp = sidecar.with_name(f"{sidecar.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "w") as f:
+            json.dump({
+                "version": _SIDECAR_VERSION,
+                "source": [mtime_ns, size],
+                "settings": settings,
+            }, f)
+        os.replace(tmp, sidecar)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_yaml(path, mtime_ns, size):
+    """
+    Parse a YAML file.
+
+    Cached on (path, mtime, size), so repeated loads of an unchanged file are
+    a dict lookup and any edit to the file invalidates the entry.  Across
+    processes, the JSON sidecar stands in for the YAML parse; PyYAML is only
+    imported when the sidecar is missing or stale.
+    """
+    settings = _read_sidecar(path, mtime_ns, size)
+    if settings is not None:
+        return settings
+
+    import yaml
+
+    # The libyaml-backed loader is several times faster; same safe semantics.
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path) as f:
+        settings = yaml.load(f, Loader=loader)
+    _write_sidecar(path, mtime_ns, size, settings)
+    return settings
 
 
 def load_settings(config_path=None):
     """
     Load the YAML config and merge with environment variable overrides.
 
-    Returns a dict with the full settings tree.
+    Returns a dict with the full settings tree.  Each call returns a fresh
+    copy, so callers may modify it without affecting other modules.
     """
     path = Path(config_path) if config_path else _DEFAULT_CONFIG
 
-    if not path.exists():
-        raise FileNotFoundError(f"Config file not found: {path}")
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Config file not found: {path}") from None
 
-    with open(path) as f:
-        settings = yaml.safe_load(f)
+    settings = copy.deepcopy(_parse_yaml(path, st.st_mtime_ns, st.st_size))
 
     # Load .env file (if present) into os.environ.
     _load_dotenv()
@@ -71,18 +188,90 @@ def load_settings(config_path=None):
     return settings
 
 
+def _queued_file_handler(log_path, level, formatter):
+    """
+    Return a QueueHandler whose records are written to `log_path` by a
+    background thread, so logging calls never block on disk I/O.
+
+    The listener thread feeds a MemoryHandler that batches up to 1024 records
+    per write (flushing immediately on ERROR and above).  One listener is
+    started per log file per process.
+    """
+    key = str(log_path)
+    entry = _FILE_LISTENERS.get(key)
+    if entry is None:
+        file_handler = logging.FileHandler(log_path)
+        file_handler.setLevel(level)
+        file_handler.setFormatter(formatter)
+        buffered = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=file_handler,
+        )
+
+        log_queue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(log_queue, buffered)
+        listener.start()
+
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        queue_handler.setLevel(level)
+        entry = (queue_handler, listener, buffered)
+        _FILE_LISTENERS[key] = entry
+    return entry[0]
+
+
+@atexit.register
+def _stop_file_listeners():
+    """Drain the log queues and flush buffered records to disk at exit."""
+    for _, listener, buffered in _FILE_LISTENERS.values():
+        listener.stop()
+        file_handler = buffered.target
+        buffered.close()  # Flushes any buffered records to the file handler.
+        file_handler.close()
+    _FILE_LISTENERS.clear()
+
+
+def _resolve_log_cfg(settings):
+    """
+    Return (level, formatter, log_to_console, log_dir) for a settings dict.
+
+    log_dir is None when file logging is disabled.  Results are cached per
+    settings object, since modules pass the same dict to every get_logger
+    call and settings aren't modified after load.
+    """
+    cached = _RESOLVED_LOG_CFG.get(id(settings))
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+
+    log_cfg = settings.get("logging", {})
+    level = getattr(logging, log_cfg.get("level", "INFO").upper(), logging.INFO)
+    fmt = log_cfg.get("format", "%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+
+    formatter = _FORMATTERS.get(fmt)
+    if formatter is None:
+        formatter = _FORMATTERS[fmt] = logging.Formatter(fmt)
+
+    log_dir = None
+    if log_cfg.get("log_to_file", True):
+        log_dir = _PROJECT_ROOT / log_cfg.get("log_dir", settings.get("paths", {}).get("log_dir", "logs"))
+
+    resolved = (level, formatter, log_cfg.get("log_to_console", True), log_dir)
+    if len(_RESOLVED_LOG_CFG) >= _RESOLVED_LOG_CFG_MAX:
+        _RESOLVED_LOG_CFG.pop(next(iter(_RESOLVED_LOG_CFG)))
+    _RESOLVED_LOG_CFG[id(settings)] = (settings, resolved)
+    return resolved
+
+
 def get_logger(name, settings=None):
     """
     Create a configured logger that writes to both console and logs/ file.
 
     The log file is named after the logger (e.g., logs/validate_dataset.log).
+    File writes are buffered and happen off the calling thread; they are
+    flushed on ERROR records and at interpreter exit.
     """
     if settings is None:
         settings = load_settings()
 
-    log_cfg = settings.get("logging", {})
-    level = getattr(logging, log_cfg.get("level", "INFO").upper(), logging.INFO)
-    fmt = log_cfg.get("format", "%(asctime)s [%(levelname)s] %(name)s: %(message)s")
+    level, formatter, log_to_console, log_dir = _resolve_log_cfg(settings)
 
     logger = logging.getLogger(name)
     logger.setLevel(level)
@@ -91,22 +280,19 @@ def get_logger(name, settings=None):
     if logger.handlers:
         return logger
 
-    formatter = logging.Formatter(fmt)
+    # Handlers are attached directly, so don't also pass records up to the root logger.
+    logger.propagate = False
 
     # Console handler.
-    if log_cfg.get("log_to_console", True):
+    if log_to_console:
         console = logging.StreamHandler()
         console.setLevel(level)
         console.setFormatter(formatter)
         logger.addHandler(console)
 
-    # File handler.
-    if log_cfg.get("log_to_file", True):
-        log_dir = _PROJECT_ROOT / log_cfg.get("log_dir", settings.get("paths", {}).get("log_dir", "logs"))
+    # File handler (written from a background thread).
+    if log_dir is not None:
         log_dir.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_dir / f"{name}.log")
-        file_handler.setLevel(level)
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        logger.addHandler(_queued_file_handler(log_dir / f"{name}.log", level, formatter))
 
     return logger
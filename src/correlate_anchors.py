@@ -14,8 +14,10 @@ Usage:
 Arguments:
     --target    Path to the target CSV (must have a 'date' column in YYYY-MM-DD format)
     --anchor    Path to the anchor CSV (must have a 'date' column in YYYY-MM-DD format)
-    --window    Number of days for the proximity window (default: 3, meaning +-3 days)
+    --window    Number of days for the proximity window
+                (default: correlation.default_window_days in config/settings.yaml)
     --baseline  Run a Monte Carlo baseline comparison with random dates
+                (correlation.baseline_simulations runs)
 
 Example:
     python src/correlate_anchors.py \\
@@ -25,22 +27,95 @@ Example:
 """
 
 import argparse
+import functools
+import os
 import sys
-from datetime import datetime, timedelta
 
 import numpy as np
-import pandas as pd
+
+# Allow running as a plain script (python src/correlate_anchors.py) as well
+# as a module by making the project root importable.
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config_loader import load_settings
+
+DATE_FORMAT = "%Y-%m-%d"
+
+# Dates are handled as int32 day ordinals (days since 1970-01-01) from load
+# through matching; only rows that get printed are turned back into dates.
+ORDINAL_DTYPE = np.int32
+
+# Monte Carlo baselines with at least this many window lookups
+# (n_simulations * anchors) use the optional Numba kernel in _kernels.
+# Importing numba and loading the cached kernel costs ~0.2-0.3 s per run,
+# which the kernel only wins back on inputs this large (sooner on machines
+# with several cores, since it runs simulations in parallel).
+BASELINE_KERNEL_MIN_LOOKUPS = 50_000_000
+
+# The Monte Carlo baseline draws at most this many random dates at a time
+# (32 MB as int64), so its memory stays flat however many simulations run.
+BASELINE_BATCH_VALUES = 4_000_000
+
+
+@functools.cache
+def _get_settings():
+    """Load settings on first use, so importing this module doesn't read config."""
+    return load_settings()
+
+
+def _read_date_column(filepath, date_column):
+    """
+    Read only `date_column` from a CSV, as a Series of strings.
+
+    Uses pyarrow's multithreaded C++ CSV reader when pyarrow is installed.
+    Falls back to pandas when it isn't, or when pyarrow can't read the file,
+    so that errors are always reported by the same code path.
+
+    Returns None if the column doesn't exist.
+    """
+    import pandas as pd
+
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        pass
+    else:
+        try:
+            table = pacsv.read_csv(
+                filepath,
+                read_options=pacsv.ReadOptions(use_threads=True),
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=[date_column],
+                    column_types={date_column: pa.string()},
+                    strings_can_be_null=True,
+                ),
+            )
+            return table.column(date_column).to_pandas()
+        except (OSError, pa.ArrowException):
+            pass
+
+    # Only the date column is parsed; other columns are skipped by the reader.
+    df = pd.read_csv(filepath, dtype=str, usecols=lambda col: col == date_column)
+    if date_column not in df.columns:
+        return None
+    return df[date_column]
 
 
 def load_dates(filepath, date_column="date"):
     """
     Load a CSV and extract valid dates from the specified column.
 
-    Returns a sorted list of datetime.date objects (skipping rows with
-    missing or unparseable dates).
+    Returns a sorted int32 NumPy array of day ordinals (days since
+    1970-01-01), skipping rows with missing or unparseable dates.
     """
+    # Imported here rather than at module level: pandas is only needed for
+    # CSV parsing and is slow to import (e.g. for --help).
+    import pandas as pd
+
     try:
-        df = pd.read_csv(filepath, dtype=str)
+        raw = _read_date_column(filepath, date_column)
     except FileNotFoundError:
         print(f"ERROR: File not found: {filepath}")
         sys.exit(2)
@@ -48,56 +123,122 @@ def load_dates(filepath, date_column="date"):
         print(f"ERROR: Could not read {filepath}: {e}")
         sys.exit(2)
 
-    if date_column not in df.columns:
+    if raw is None:
         print(f"ERROR: '{date_column}' column not found in {filepath}.")
-        print(f"  Available columns: {list(df.columns)}")
+        print(f"  Available columns: {list(pd.read_csv(filepath, nrows=0).columns)}")
         sys.exit(1)
 
-    dates = []
-    skipped = 0
-    for val in df[date_column]:
-        if pd.isna(val) or str(val).strip() == "":
-            skipped += 1
-            continue
-        try:
-            d = datetime.strptime(str(val).strip(), "%Y-%m-%d").date()
-            dates.append(d)
-        except ValueError:
-            skipped += 1
+    # One vectorized parse; empty or malformed values become NaT.
+    parsed = pd.to_datetime(raw.str.strip(), format=DATE_FORMAT, errors="coerce")
+    skipped = int(parsed.isna().sum())
+
+    dates = parsed.dropna().to_numpy().astype("datetime64[D]").view("i8").astype(ORDINAL_DTYPE)
+    dates.sort()
 
     if skipped > 0:
         print(f"  Note: Skipped {skipped} rows in {filepath} (missing or unparseable dates).")
 
-    return sorted(dates)
+    return dates
+
+
+def _to_ordinals(dates):
+    """
+    Convert a sequence of dates (datetime.date objects, datetime64 values, or
+    day ordinals as returned by load_dates) to a sorted ordinal array.
+    """
+    arr = np.asarray(dates)
+    if arr.dtype.kind not in "iu":
+        arr = arr.astype("datetime64[D]").view("i8")
+    return np.sort(arr.astype(ORDINAL_DTYPE, copy=False))
+
+
+def _ordinal_to_date(ordinal):
+    """Convert a single day ordinal back to a datetime.date (used for display only)."""
+    return np.datetime64(int(ordinal), "D").astype(object)
+
+
+def _get_kernels():
+    """The _kernels module if numba is installed, else None (imported on first use)."""
+    from src import _kernels  # Imports numba, so only when it will pay off.
+
+    return _kernels if _kernels.HAVE_NUMBA else None
+
+
+def _distinct_sorted(values):
+    """Distinct values of an already-sorted array (np.unique without the sort)."""
+    keep = np.ones(len(values), dtype=bool)
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
 
 
 def find_matches(target_dates, anchor_dates, window_days):
     """
     For each anchor date, find target events within +-window_days.
 
+    Both inputs are converted to sorted day ordinals, and the window for each
+    anchor is located in the targets with a binary search, so the cost is
+    O((N + M) log N) plus the number of matches instead of O(N * M).
+
     Returns:
-        matches: list of (target_date, anchor_date, delta_days) tuples
-        matched_targets: set of target dates that matched at least one anchor
-        matched_anchors: set of anchor dates that matched at least one target
+        matches: int32 array of shape (n_matches, 3) with one
+            (target_ordinal, anchor_ordinal, delta_days) row per match,
+            ordered by anchor and then by target
+        matched_targets: sorted array of target ordinals that matched at least one anchor
+        matched_anchors: sorted array of anchor ordinals that matched at least one target
     """
-    matches = []
-    matched_targets = set()
-    matched_anchors = set()
+    targets = _to_ordinals(target_dates)
+    anchors = _to_ordinals(anchor_dates)
+
+    lo = np.searchsorted(targets, anchors - window_days, side="left")
+    hi = np.searchsorted(targets, anchors + window_days, side="right")
+    # A negative window is empty: hi can then fall below lo.
+    counts = np.maximum(hi - lo, 0)
+
+    # Expand each anchor's [lo, hi) slice into flat target indices without a
+    # Python loop: position within the slice plus the slice start.
+    n_matches = int(counts.sum())
+    starts = np.cumsum(counts) - counts
+    target_idx = np.arange(n_matches) - np.repeat(starts - lo, counts)
 
-    for anchor_date in anchor_dates:
-        window_start = anchor_date - timedelta(days=window_days)
-        window_end = anchor_date + timedelta(days=window_days)
+    anchors_flat = np.repeat(anchors, counts)
+    targets_flat = targets[target_idx]
+    matches = np.column_stack((targets_flat, anchors_flat, targets_flat - anchors_flat))
 
-        for target_date in target_dates:
-            if window_start <= target_date <= window_end:
-                delta = (target_date - anchor_date).days
-                matches.append((target_date, anchor_date, delta))
-                matched_targets.add(target_date)
-                matched_anchors.add(anchor_date)
+    # Per-position hit masks instead of sets or np.unique: both arrays are
+    # already sorted, so only adjacent duplicates need dropping.
+    target_hit = np.zeros(len(targets), dtype=bool)
+    target_hit[target_idx] = True
+    anchor_hit = counts > 0
+
+    matched_targets = _distinct_sorted(targets[target_hit])
+    matched_anchors = _distinct_sorted(anchors[anchor_hit])
 
     return matches, matched_targets, matched_anchors
 
 
+def _baseline_counts_numpy(samples, lo_bounds, hi_bounds, span):
+    """
+    NumPy fallback for _kernels.baseline_counts: match count per simulation
+    row of `samples` (sorted day offsets in [0, span)), given each anchor's
+    half-open [lo, hi) window in the same offset space.
+    """
+    n_simulations = samples.shape[0]
+
+    # Windows clipped to the sampled range, so they stay inside one row's band.
+    lo_bounds = np.clip(lo_bounds, 0, span)
+    hi_bounds = np.clip(hi_bounds, 0, span)
+
+    # Shift row i into its own [i * span, (i + 1) * span) band so a single
+    # searchsorted over the flattened samples counts every simulation.
+    row_offset = (np.arange(n_simulations) * span)[:, None]
+    flat = (samples + row_offset).ravel()
+    per_anchor = (
+        np.searchsorted(flat, hi_bounds + row_offset)
+        - np.searchsorted(flat, lo_bounds + row_offset)
+    )
+    return per_anchor.sum(axis=1)
+
+
 def run_baseline(target_dates, anchor_dates, window_days, n_simulations=1000):
     """
     Monte Carlo baseline: generate random target dates within the same date
@@ -105,31 +246,41 @@ def run_baseline(target_dates, anchor_dates, window_days, n_simulations=1000):
 
     Returns the mean and standard deviation of the match count across simulations.
     """
-    if not target_dates or not anchor_dates:
+    targets = _to_ordinals(target_dates)
+    anchors = _to_ordinals(anchor_dates)
+    if len(targets) == 0 or len(anchors) == 0:
         return 0.0, 0.0
 
-    date_min = min(target_dates)
-    date_max = max(target_dates)
-    total_days = (date_max - date_min).days
+    date_min = int(targets[0])
+    total_days = int(targets[-1]) - date_min
     if total_days <= 0:
         return 0.0, 0.0
 
-    n_target = len(target_dates)
-    match_counts = []
-
-    for _ in range(n_simulations):
-        # Generate random dates in the same range.
-        random_offsets = np.random.randint(0, total_days + 1, size=n_target)
-        random_dates = [date_min + timedelta(days=int(offset)) for offset in random_offsets]
-
-        count = 0
-        for anchor_date in anchor_dates:
-            window_start = anchor_date - timedelta(days=window_days)
-            window_end = anchor_date + timedelta(days=window_days)
-            for rd in random_dates:
-                if window_start <= rd <= window_end:
-                    count += 1
-        match_counts.append(count)
+    n_target = len(targets)
+    span = total_days + 1
+
+    # Anchor windows are loop-invariant across simulations: compute them once,
+    # as half-open [lo, hi) ranges in the same offset space as the samples.
+    # A negative window is empty: hi_bounds is clamped so it can't cross lo.
+    lo_bounds = anchors.astype(np.int64) - date_min - window_days
+    hi_bounds = np.maximum(lo_bounds + 2 * window_days + 1, lo_bounds)
+
+    kernels = _get_kernels() if n_simulations * len(anchors) >= BASELINE_KERNEL_MIN_LOOKUPS else None
+
+    # Simulations are drawn a batch of rows at a time: one sorted row of
+    # random day offsets (relative to date_min) per simulation.  Successive
+    # draws continue the same random stream, so a seeded run gives the same
+    # counts whatever the batch size.
+    batch_rows = max(1, BASELINE_BATCH_VALUES // n_target)
+    match_counts = np.empty(n_simulations, dtype=np.int64)
+    for start in range(0, n_simulations, batch_rows):
+        stop = min(start + batch_rows, n_simulations)
+        samples = np.random.randint(0, span, size=(stop - start, n_target))
+        samples.sort(axis=1)
+        if kernels is not None:
+            match_counts[start:stop] = kernels.baseline_counts(samples, lo_bounds, hi_bounds)
+        else:
+            match_counts[start:stop] = _baseline_counts_numpy(samples, lo_bounds, hi_bounds, span)
 
     return float(np.mean(match_counts)), float(np.std(match_counts))
 
@@ -137,54 +288,63 @@ def run_baseline(target_dates, anchor_dates, window_days, n_simulations=1000):
 def print_report(target_path, anchor_path, target_dates, anchor_dates,
                  window_days, matches, matched_targets, matched_anchors,
                  baseline_mean=None, baseline_std=None):
-    """Print a formatted correlation report."""
-    print()
-    print("=" * 70)
-    print("  TEMPORAL CORRELATION REPORT")
-    print("=" * 70)
-    print(f"  Target:  {target_path} ({len(target_dates)} valid dates)")
-    print(f"  Anchor:  {anchor_path} ({len(anchor_dates)} valid dates)")
-    print(f"  Window:  +-{window_days} days")
-    print()
-    print(f"  Total matches:          {len(matches)}")
-    print(f"  Unique target matches:  {len(matched_targets)} / {len(target_dates)}"
-          f" ({len(matched_targets)/len(target_dates)*100:.1f}%)" if target_dates else "")
-    print(f"  Unique anchor matches:  {len(matched_anchors)} / {len(anchor_dates)}"
-          f" ({len(matched_anchors)/len(anchor_dates)*100:.1f}%)" if anchor_dates else "")
+    """Print a formatted correlation report (built up, then written in one call)."""
+    lines = [
+        "",
+        "=" * 70,
+        "  TEMPORAL CORRELATION REPORT",
+        "=" * 70,
+        f"  Target:  {target_path} ({len(target_dates)} valid dates)",
+        f"  Anchor:  {anchor_path} ({len(anchor_dates)} valid dates)",
+        f"  Window:  +-{window_days} days",
+        "",
+        f"  Total matches:          {len(matches)}",
+        f"  Unique target matches:  {len(matched_targets)} / {len(target_dates)}"
+        f" ({len(matched_targets)/len(target_dates)*100:.1f}%)" if len(target_dates) else "",
+        f"  Unique anchor matches:  {len(matched_anchors)} / {len(anchor_dates)}"
+        f" ({len(matched_anchors)/len(anchor_dates)*100:.1f}%)" if len(anchor_dates) else "",
+    ]
 
     # Baseline comparison.
     if baseline_mean is not None:
-        print()
-        print(f"  Baseline (random dates): {baseline_mean:.1f} +- {baseline_std:.1f} matches")
+        lines.append("")
+        lines.append(f"  Baseline (random dates): {baseline_mean:.1f} +- {baseline_std:.1f} matches")
         if baseline_std > 0:
             z_score = (len(matches) - baseline_mean) / baseline_std
-            print(f"  Z-score: {z_score:.2f}", end="")
             if abs(z_score) > 2.0:
-                print("  (statistically significant at p < 0.05)")
+                verdict = "  (statistically significant at p < 0.05)"
             elif abs(z_score) > 1.5:
-                print("  (marginally significant)")
+                verdict = "  (marginally significant)"
             else:
-                print("  (not statistically significant - likely chance)")
+                verdict = "  (not statistically significant - likely chance)"
+            lines.append(f"  Z-score: {z_score:.2f}{verdict}")
         else:
-            print("  Z-score: N/A (zero variance in baseline)")
+            lines.append("  Z-score: N/A (zero variance in baseline)")
 
     # Show match details (up to 20).
-    if matches:
-        print()
-        print("  Match Details (up to 20 shown):")
-        print("  " + "-" * 55)
-        print(f"  {'Target Date':<15} {'Anchor Date':<15} {'Delta (days)':<12}")
-        print("  " + "-" * 55)
-        for target_date, anchor_date, delta in matches[:20]:
-            sign = "+" if delta >= 0 else ""
-            print(f"  {target_date}       {anchor_date}       {sign}{delta}")
+    if len(matches):
+        lines.append("")
+        lines.append("  Match Details (up to 20 shown):")
+        lines.append("  " + "-" * 55)
+        lines.append(f"  {'Target Date':<15} {'Anchor Date':<15} {'Delta (days)':<12}")
+        lines.append("  " + "-" * 55)
+        lines.extend(
+            f"  {_ordinal_to_date(target_ord)}       {_ordinal_to_date(anchor_ord)}"
+            f"       {'+' if delta >= 0 else ''}{delta}"
+            for target_ord, anchor_ord, delta in matches[:20].tolist()
+        )
         if len(matches) > 20:
-            print(f"  ... and {len(matches) - 20} more matches.")
+            lines.append(f"  ... and {len(matches) - 20} more matches.")
 
-    print()
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main():
+    correlation_cfg = _get_settings().get("correlation", {})
+    default_window = correlation_cfg.get("default_window_days", 3)
+    n_simulations = correlation_cfg.get("baseline_simulations", 1000)
+
     parser = argparse.ArgumentParser(
         description="Calculate temporal proximity between a target and anchor dataset."
     )
@@ -197,12 +357,12 @@ def main():
         help="Path to the anchor CSV (must have a 'date' column)."
     )
     parser.add_argument(
-        "--window", type=int, default=3,
-        help="Proximity window in days (default: 3, meaning +-3 days)."
+        "--window", type=int, default=default_window,
+        help=f"Proximity window in days (default: {default_window}, meaning +-{default_window} days)."
     )
     parser.add_argument(
         "--baseline", action="store_true",
-        help="Run a Monte Carlo baseline comparison with 1000 random simulations."
+        help=f"Run a Monte Carlo baseline comparison with {n_simulations} random simulations."
     )
     args = parser.parse_args()
 
@@ -212,10 +372,10 @@ def main():
     print(f"Loading anchor: {args.anchor}")
     anchor_dates = load_dates(args.anchor)
 
-    if not target_dates:
+    if len(target_dates) == 0:
         print("ERROR: No valid dates found in the target dataset.")
         sys.exit(1)
-    if not anchor_dates:
+    if len(anchor_dates) == 0:
         print("ERROR: No valid dates found in the anchor dataset.")
         sys.exit(1)
 
@@ -228,9 +388,9 @@ def main():
     baseline_mean = None
     baseline_std = None
     if args.baseline:
-        print("  Running baseline simulation (1000 iterations)...")
+        print(f"  Running baseline simulation ({n_simulations} iterations)...")
         baseline_mean, baseline_std = run_baseline(
-            target_dates, anchor_dates, args.window
+            target_dates, anchor_dates, args.window, n_simulations
         )
 
     print_report(
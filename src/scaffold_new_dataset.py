@@ -11,12 +11,11 @@ blank CSV file so you don't have to remember or type the column headers manually
 The generated CSV follows the Data Schema Standard defined in docs/DATA_SCHEMA_STANDARD.md.
 """
 
+import csv
 import os
 import sys
 from datetime import datetime
 
-import pandas as pd
-
 
 # ── Standard Schema columns ──────────────────────────────────────────────────
 # Required columns that every dataset must have.
@@ -122,13 +121,12 @@ def create_csv(entity, selected_types, use_recommended, filename):
     if use_recommended:
         columns.extend(RECOMMENDED_COLUMNS)
 
-    # Create an empty DataFrame with the standard columns.
-    df = pd.DataFrame(columns=columns)
-
     # Determine output path: put it in the current working directory.
     output_path = os.path.join(os.getcwd(), filename)
 
-    df.to_csv(output_path, index=False)
+    # The file is just the header row, so write it directly.
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f, lineterminator="\n").writerow(columns)
 
     return output_path, columns, selected_types
 
@@ -45,29 +45,107 @@ USAGE
     # Fetch more results (default is 10)
     python src/scrape_serp.py "SEC enforcement actions" --num 20
 
-    # Custom output filename
+    # Custom output filename (end it in .gz for a gzip-compressed CSV)
     python src/scrape_serp.py "DHS border policy" --output dhs_results.csv
+
+    # Run many queries at once (one per line; blank lines and # comments
+    # are skipped).  Searches run in parallel and land in one CSV.
+    python src/scrape_serp.py --queries-file queries.txt --entity FDA
+
+    # Results are cached in ~/.cache/osint-serp for 7 days, so re-running a
+    # query doesn't use up a search.  Bypass the cache, or shorten its life:
+    python src/scrape_serp.py "SEC enforcement actions" --no-cache
+    python src/scrape_serp.py "SEC enforcement actions" --cache-ttl 1
 ---------------------------------------------------------------------
 """
 
 import argparse
 import csv
+import functools
+import gzip
+import hashlib
+import itertools
+import json
 import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from pathlib import Path
 from urllib.parse import urlencode
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from src.config_loader import load_settings, get_logger
 
+# orjson is not in requirements.txt; if it is installed it decodes the
+# (often 100 KB+) SerpApi responses several times faster than stdlib json.
+try:
+    import orjson as _json
+except ImportError:
+    _json = json
+
+
 # ── Config ────────────────────────────────────────────────────────────────────
-_settings = load_settings()
-logger = get_logger("scrape_serp", _settings)
+
+@functools.cache
+def _get_settings():
+    """Load settings (and .env) on first use, so importing this module doesn't read config."""
+    return load_settings()
+
+
+@functools.cache
+def _get_logger():
+    return get_logger("scrape_serp", _get_settings())
+
+
+def __getattr__(name):
+    # `logger` and `_settings` used to be built at import; keep them reachable
+    # as module attributes for code that still reads them.
+    if name == "logger":
+        return _get_logger()
+    if name == "_settings":
+        return _get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Today's date, taken once per run: every row written by this process gets
+# the same date_scraped, and the default output filename matches it.
+_TODAY = datetime.now()
 
 # SerpApi base URL
 SERPAPI_URL = "https://serpapi.com/search"
 
+# Responses are cached on disk so re-running a query (e.g. while adjusting
+# --entity or --event-type) doesn't spend another paid search.
+_CACHE_DIR = Path.home() / ".cache" / "osint-serp"
+DEFAULT_CACHE_TTL = 7 * 24 * 60 * 60  # seconds
+
+# Most searches search_many() runs at once on the shared session.
+SEARCH_WORKERS = 8
+
+# One shared session so repeated searches reuse the TCP/TLS connection
+# instead of opening a new one per request.  The pool keeps one connection
+# per worker; a smaller pool would discard the extras after each request.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "osint-scraper/1.0"})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=SEARCH_WORKERS))
+
+# Column order of the CSVs written by this script.
+FIELDS = (
+    "date",
+    "entity",
+    "event_type",
+    "source_url",
+    "verification_status",
+    "title",
+    "snippet",
+    "date_scraped",
+    "notes",
+)
+
 
 def _get_api_key():
     """
@@ -76,6 +154,7 @@ def _get_api_key():
     The key is loaded from .env by config_loader.  If it is missing the
     script exits with a helpful message so the user knows what to do.
     """
+    _get_settings()  # Loads .env into os.environ.
     key = os.environ.get("SERPAPI_KEY", "").strip()
     if not key:
         print(
@@ -93,7 +172,39 @@ def _get_api_key():
     return key
 
 
-def search_serpapi(query, api_key, num_results=10):
+def _cache_path(query, num_results):
+    """Cache file for a search.  The API key is not part of the key."""
+    key = hashlib.sha256(f"{query}|{num_results}|google".encode("utf-8")).hexdigest()
+    return _CACHE_DIR / f"{key}.json"
+
+
+def _read_cache(path, ttl):
+    """Return cached results younger than `ttl` seconds, or None."""
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        return _json.loads(path.read_bytes())["organic_results"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_cache(path, results):
+    """Best-effort write of a cache entry; failures only cost a re-fetch."""
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"organic_results": results}, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        _get_logger().warning("Could not write SerpApi cache %s: %s", path, e)
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def search_serpapi(query, api_key, num_results=10, session=None, cache_ttl=DEFAULT_CACHE_TTL):
     """
     Send a search query to SerpApi and return a list of result dicts.
 
@@ -107,12 +218,26 @@ def search_serpapi(query, api_key, num_results=10):
         Your SerpApi API key.
     num_results : int
         How many results to request (max ~100 per call).
+    session : requests.Session, optional
+        Session to send the request with.  Defaults to the module's shared
+        keep-alive session.
+    cache_ttl : float
+        Reuse a cached response for the same query and num_results if it is
+        younger than this many seconds (default: 7 days).  0 or None skips
+        the cache entirely.
 
     Returns
     -------
     list[dict]
         One dict per organic search result.
     """
+    cache_file = _cache_path(query, num_results) if cache_ttl else None
+    if cache_file is not None:
+        results = _read_cache(cache_file, cache_ttl)
+        if results is not None:
+            _get_logger().info("Using cached SerpApi results: %s", query)
+            return results
+
     params = {
         "q": query,
         "api_key": api_key,
@@ -120,8 +245,8 @@ def search_serpapi(query, api_key, num_results=10):
         "num": num_results,
     }
 
-    logger.info("Searching SerpApi: %s", query)
-    resp = requests.get(SERPAPI_URL, params=params, timeout=30)
+    _get_logger().info("Searching SerpApi: %s", query)
+    resp = (session or _SESSION).get(SERPAPI_URL, params=params, timeout=30)
 
     if resp.status_code == 401:
         print("ERROR: Invalid API key. Check your SERPAPI_KEY in .env.")
@@ -131,13 +256,74 @@ def search_serpapi(query, api_key, num_results=10):
         sys.exit(1)
 
     resp.raise_for_status()
-    data = resp.json()
+    data = _json.loads(resp.content)
 
     results = data.get("organic_results", [])
-    logger.info("Got %d results from SerpApi", len(results))
+    _get_logger().info("Got %d results from SerpApi", len(results))
+    if cache_file is not None:
+        _write_cache(cache_file, results)
     return results
 
 
+def search_many(queries, api_key, num_results=10, workers=SEARCH_WORKERS, session=None,
+                cache_ttl=DEFAULT_CACHE_TTL):
+    """
+    Run several SerpApi searches concurrently and yield (query, results).
+
+    Searches are network-bound, so up to `workers` of them are in flight at
+    once (at most SEARCH_WORKERS on the shared session, the size of its
+    connection pool).  Pairs are yielded as each search finishes, not in
+    input order.  An error in any search (including the sys.exit() on a
+    bad key) is re-raised here.
+    """
+    queries = list(queries)
+    if not queries:
+        return
+    if session is None:
+        workers = min(workers, SEARCH_WORKERS)
+    _get_logger()  # Set up logging once, before the worker threads race to.
+    with ThreadPoolExecutor(max_workers=min(workers, len(queries))) as pool:
+        futures = {
+            pool.submit(search_serpapi, query, api_key, num_results, session, cache_ttl): query
+            for query in queries
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def _read_queries(path):
+    """Read one query per line, skipping blank lines and # comments."""
+    with open(path, encoding="utf-8") as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.lstrip().startswith("#")
+        ]
+
+
+def iter_rows(results, entity, event_type, query=""):
+    """
+    Yield one CSV row per SerpApi result, as a tuple in FIELDS order.
+
+    This is the streaming form of results_to_rows(): write_csv() consumes it
+    directly, so no intermediate list of dicts is built.
+    """
+    today = _TODAY.strftime("%Y-%m-%d")
+    notes = f"Auto-collected via SerpApi. Query: {query}"
+
+    for r in results:
+        yield (
+            "",  # date: must be filled in manually after reviewing each result
+            entity,
+            event_type,
+            r.get("link", ""),
+            "Unverified",
+            r.get("title", ""),
+            r.get("snippet", ""),
+            today,
+            notes,
+        )
+
+
 def results_to_rows(results, entity, event_type, query=""):
     """
     Convert raw SerpApi results into rows matching the Data Schema Standard.
@@ -156,40 +342,49 @@ def results_to_rows(results, entity, event_type, query=""):
     Returns
     -------
     list[dict]
-        Rows ready to write to CSV.
+        Rows ready to write to CSV, keyed by FIELDS.
     """
-    today = datetime.now().strftime("%Y-%m-%d")
-    rows = []
-
-    for r in results:
-        rows.append({
-            "date": "",  # Must be filled in manually after reviewing each result
-            "entity": entity,
-            "event_type": event_type,
-            "source_url": r.get("link", ""),
-            "verification_status": "Unverified",
-            "title": r.get("title", ""),
-            "snippet": r.get("snippet", ""),
-            "date_scraped": today,
-            "notes": f"Auto-collected via SerpApi. Query: {query}",
-        })
-
-    return rows
+    return [dict(zip(FIELDS, row)) for row in iter_rows(results, entity, event_type, query)]
 
 
 def write_csv(rows, output_path):
-    """Write rows to a CSV file with the standard headers."""
-    if not rows:
+    """
+    Write rows to a CSV file with the standard headers.
+
+    `rows` can be any iterable of tuples in FIELDS order (as yielded by
+    iter_rows()) or of dicts (as returned by results_to_rows(), in which case
+    the first dict's keys become the header).  Rows are streamed to disk,
+    gzip-compressed if `output_path` ends in ".gz".
+    """
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
         print("No results to write.")
         return
 
-    fieldnames = list(rows[0].keys())
-    with open(output_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
+    rows = itertools.chain([first], rows)
+    if isinstance(first, dict):
+        header = list(first.keys())
+        rows = ([row.get(key, "") for key in header] for row in rows)
+    else:
+        header = FIELDS
+
+    # zip() stops pulling from the counter once rows run out, so the next
+    # value it yields is the number of rows written.
+    counter = itertools.count()
+    if str(output_path).endswith(".gz"):
+        # Level 1 compresses CSV text well at a fraction of the default's CPU cost.
+        f = gzip.open(output_path, "wt", newline="", encoding="utf-8", compresslevel=1)
+    else:
+        # A 1 MiB buffer turns large outputs into a few big writes instead of
+        # one syscall per 8 KiB.
+        f = open(output_path, "w", newline="", encoding="utf-8", buffering=1 << 20)
+    with f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(row for row, _ in zip(rows, counter))
 
-    print(f"\nSaved {len(rows)} rows to {output_path}")
+    print(f"\nSaved {next(counter)} rows to {output_path}")
 
 
 def main():
@@ -201,8 +396,14 @@ def main():
     )
     parser.add_argument(
         "query",
+        nargs="?",
         help='Search query, e.g. "BlackRock acquisitions 2024"',
     )
+    parser.add_argument(
+        "--queries-file",
+        default="",
+        help="Text file with one search query per line (run in parallel)",
+    )
     parser.add_argument(
         "--entity",
         default="Unknown",
@@ -217,33 +418,59 @@ def main():
         "--num",
         type=int,
         default=10,
-        help="Number of results to fetch (default: 10)",
+        help="Number of results to fetch per query (default: 10)",
     )
     parser.add_argument(
         "--output",
         default="",
         help="Output CSV filename (default: auto-generated)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always query SerpApi, ignoring and not writing the local cache",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL / 86400,
+        help="Reuse cached results younger than this many days (default: 7)",
+    )
     args = parser.parse_args()
 
+    queries = [args.query] if args.query else []
+    if args.queries_file:
+        queries.extend(_read_queries(args.queries_file))
+    if not queries:
+        parser.error("give a query or --queries-file")
+
     api_key = _get_api_key()
 
-    # Search
-    results = search_serpapi(args.query, api_key, num_results=args.num)
+    # Search (in parallel when there is more than one query)
+    cache_ttl = 0 if args.no_cache else args.cache_ttl * 86400
+    searches = search_many(queries, api_key, num_results=args.num, cache_ttl=cache_ttl)
 
-    if not results:
+    # Convert to standard rows (streamed straight into the CSV)
+    rows = itertools.chain.from_iterable(
+        iter_rows(results, args.entity, args.event_type, query=query)
+        for query, results in searches
+    )
+    first = next(rows, None)
+    if first is None:
         print("No results found for that query.")
         sys.exit(0)
-
-    # Convert to standard rows
-    rows = results_to_rows(results, args.entity, args.event_type, query=args.query)
+    rows = itertools.chain([first], rows)
 
     # Output path
     if args.output:
         output_path = args.output
     else:
-        safe_query = args.query[:30].replace(" ", "_").replace("/", "_")
-        output_path = f"scraped_{safe_query}_{datetime.now().strftime('%Y%m%d')}.csv"
+        if args.query:
+            name = args.query
+        else:
+            name = os.path.splitext(os.path.basename(args.queries_file))[0]
+        safe_query = name[:30].replace(" ", "_").replace("/", "_")
+        output_path = f"scraped_{safe_query}_{_TODAY.strftime('%Y%m%d')}.csv"
 
     write_csv(rows, output_path)
 
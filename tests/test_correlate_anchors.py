@@ -0,0 +1,245 @@
+"""
+test_correlate_anchors.py - Tests for the temporal correlation script.
+
+These tests check the match-finding logic against a brute-force reference
+so that speedups to the core loop can't silently change the results.
+
+Run with:
+    pytest tests/test_correlate_anchors.py -v
+"""
+
+import os
+import random
+import subprocess
+import sys
+from datetime import date, timedelta
+
+import numpy as np
+import pytest
+
+from src import _kernels, correlate_anchors
+from src.correlate_anchors import find_matches, load_dates, run_baseline
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+@pytest.fixture(params=[True, False], ids=["numba", "numpy"])
+def kernel_backend(request, monkeypatch):
+    """Run baseline tests against both the Numba kernel and the NumPy fallback."""
+    if request.param and not _kernels.HAVE_NUMBA:
+        pytest.skip("numba is not installed")
+    monkeypatch.setattr(_kernels, "HAVE_NUMBA", request.param)
+    # Small test inputs would never reach the kernel otherwise.
+    monkeypatch.setattr(correlate_anchors, "BASELINE_KERNEL_MIN_LOOKUPS", 0)
+    return request.param
+
+
+def _brute_force(target_dates, anchor_dates, window_days):
+    """Reference implementation: check every (anchor, target) pair."""
+    matches = []
+    for anchor_date in sorted(anchor_dates):
+        for target_date in sorted(target_dates):
+            delta = (target_date - anchor_date).days
+            if -window_days <= delta <= window_days:
+                matches.append((target_date, anchor_date, delta))
+    return matches
+
+
+def _as_tuples(matches):
+    """Convert the ordinal match array back to (date, date, delta) tuples."""
+    epoch = date(1970, 1, 1)
+    return [
+        (epoch + timedelta(days=t), epoch + timedelta(days=a), d)
+        for t, a, d in matches.tolist()
+    ]
+
+
+# ── Tests: load_dates ──────────────────────────────────────────────────────
+
+@pytest.fixture(params=["pyarrow", "pandas"])
+def csv_reader(request, monkeypatch):
+    """Run load_dates tests with and without the optional pyarrow reader."""
+    if request.param == "pyarrow":
+        pytest.importorskip("pyarrow.csv")
+    else:
+        monkeypatch.setitem(sys.modules, "pyarrow.csv", None)  # Import raises ImportError.
+    return request.param
+
+
+@pytest.mark.usefixtures("csv_reader")
+class TestLoadDates:
+    def test_skips_bad_rows_and_sorts(self, tmp_path, capsys):
+        """Empty and malformed dates are skipped; the rest come back sorted."""
+        path = tmp_path / "dates.csv"
+        path.write_text(
+            "date,title\n"
+            "2024-03-01,a\n"
+            ",b\n"
+            "03/01/2024,c\n"
+            " 2024-01-15 ,d\n"
+            "2024-02-30,e\n"
+        )
+        dates = load_dates(str(path))
+        expected = np.array(["2024-01-15", "2024-03-01"], dtype="datetime64[D]").view("i8")
+        assert dates.dtype == np.int32
+        assert dates.tolist() == expected.tolist()
+        assert "Skipped 3 rows" in capsys.readouterr().out
+
+    def test_missing_column_exits(self, tmp_path):
+        """A CSV without the date column should exit with code 1."""
+        path = tmp_path / "nodate.csv"
+        path.write_text("Date,title\n2024-01-01,a\n")
+        with pytest.raises(SystemExit) as exc:
+            load_dates(str(path))
+        assert exc.value.code == 1
+
+    def test_missing_file_exits(self, tmp_path):
+        """A nonexistent file should exit with code 2."""
+        with pytest.raises(SystemExit) as exc:
+            load_dates(str(tmp_path / "missing.csv"))
+        assert exc.value.code == 2
+
+
+# ── Tests: find_matches ─────────────────────────────────────────────────────
+
+class TestFindMatches:
+    def test_simple_window(self):
+        """Targets inside the window match; targets outside do not."""
+        targets = [date(2024, 1, 1), date(2024, 1, 10), date(2024, 1, 13)]
+        anchors = [date(2024, 1, 12)]
+        matches, matched_targets, matched_anchors = find_matches(targets, anchors, 3)
+        assert _as_tuples(matches) == [
+            (date(2024, 1, 10), date(2024, 1, 12), -2),
+            (date(2024, 1, 13), date(2024, 1, 12), 1),
+        ]
+        assert len(matched_targets) == 2
+        assert len(matched_anchors) == 1
+
+    def test_window_edges_inclusive(self):
+        """Targets exactly window_days away should count as matches."""
+        targets = [date(2024, 1, 7), date(2024, 1, 13)]
+        anchors = [date(2024, 1, 10)]
+        matches, _, _ = find_matches(targets, anchors, 3)
+        assert len(matches) == 2
+
+    def test_no_matches(self):
+        """Far-apart datasets should produce no matches."""
+        targets = [date(2020, 1, 1)]
+        anchors = [date(2024, 1, 1)]
+        matches, matched_targets, matched_anchors = find_matches(targets, anchors, 3)
+        assert len(matches) == 0
+        assert len(matched_targets) == 0
+        assert len(matched_anchors) == 0
+
+    def test_duplicate_dates_counted_once_in_unique_sets(self):
+        """Duplicate dates each produce a match but count once as unique."""
+        targets = [date(2024, 1, 10), date(2024, 1, 10)]
+        anchors = [date(2024, 1, 11), date(2024, 1, 11)]
+        matches, matched_targets, matched_anchors = find_matches(targets, anchors, 1)
+        assert len(matches) == 4
+        assert len(matched_targets) == 1
+        assert len(matched_anchors) == 1
+
+    def test_negative_window_matches_nothing(self):
+        """A negative window is empty rather than an error."""
+        targets = [date(2024, 1, 10), date(2024, 1, 11), date(2024, 1, 12)]
+        anchors = [date(2024, 1, 11)]
+        matches, matched_targets, matched_anchors = find_matches(targets, anchors, -1)
+        assert len(matches) == 0
+        assert len(matched_targets) == 0
+        assert len(matched_anchors) == 0
+
+    @pytest.mark.parametrize("window_days", [0, 1, 3, 7])
+    def test_matches_brute_force(self, window_days):
+        """Random datasets should match the O(N*M) reference exactly."""
+        rng = random.Random(window_days)
+        start = date(2015, 1, 1)
+        targets = [start + timedelta(days=rng.randint(0, 3650)) for _ in range(300)]
+        anchors = [start + timedelta(days=rng.randint(0, 3650)) for _ in range(50)]
+
+        matches, matched_targets, matched_anchors = find_matches(targets, anchors, window_days)
+        expected = _brute_force(targets, anchors, window_days)
+
+        assert _as_tuples(matches) == expected
+        assert len(matched_targets) == len({t for t, _, _ in expected})
+        assert len(matched_anchors) == len({a for _, a, _ in expected})
+
+
+# ── Tests: run_baseline ─────────────────────────────────────────────────────
+
+def _brute_force_baseline(target_dates, anchor_dates, window_days, n_simulations):
+    """Reference implementation: one Python double loop per simulation."""
+    date_min, date_max = min(target_dates), max(target_dates)
+    total_days = (date_max - date_min).days
+    counts = []
+    for _ in range(n_simulations):
+        offsets = np.random.randint(0, total_days + 1, size=len(target_dates))
+        random_dates = [date_min + timedelta(days=int(o)) for o in offsets]
+        counts.append(sum(
+            1
+            for a in anchor_dates
+            for rd in random_dates
+            if abs((rd - a).days) <= window_days
+        ))
+    return float(np.mean(counts)), float(np.std(counts))
+
+
+@pytest.mark.usefixtures("kernel_backend")
+class TestRunBaseline:
+    def test_matches_brute_force_with_same_seed(self):
+        """The vectorized baseline should reproduce the per-simulation loop."""
+        rng = random.Random(42)
+        start = date(2018, 1, 1)
+        targets = [start + timedelta(days=rng.randint(0, 700)) for _ in range(40)]
+        anchors = [start + timedelta(days=rng.randint(-30, 730)) for _ in range(15)]
+
+        np.random.seed(7)
+        expected = _brute_force_baseline(targets, anchors, 3, 50)
+        np.random.seed(7)
+        result = run_baseline(targets, anchors, 3, n_simulations=50)
+
+        assert result == pytest.approx(expected)
+
+    def test_batches_match_single_draw(self, monkeypatch):
+        """Drawing simulations in small batches should not change seeded results."""
+        rng = random.Random(5)
+        start = date(2018, 1, 1)
+        targets = [start + timedelta(days=rng.randint(0, 700)) for _ in range(40)]
+        anchors = [start + timedelta(days=rng.randint(0, 700)) for _ in range(15)]
+
+        np.random.seed(11)
+        expected = run_baseline(targets, anchors, 3, n_simulations=50)
+        monkeypatch.setattr(correlate_anchors, "BASELINE_BATCH_VALUES", 40 * 7)
+        np.random.seed(11)
+        assert run_baseline(targets, anchors, 3, n_simulations=50) == expected
+
+    def test_empty_inputs(self):
+        """Empty datasets should return a zero baseline."""
+        assert run_baseline([], [date(2024, 1, 1)], 3) == (0.0, 0.0)
+        assert run_baseline([date(2024, 1, 1)], [], 3) == (0.0, 0.0)
+
+    def test_negative_window_is_zero(self):
+        """A negative window can't produce negative match counts."""
+        targets = [date(2024, 1, 1) + timedelta(days=d) for d in range(0, 60, 3)]
+        anchors = [date(2024, 1, 10), date(2024, 2, 1)]
+        assert run_baseline(targets, anchors, -1, n_simulations=10) == (0.0, 0.0)
+
+    def test_single_day_range(self):
+        """A target set spanning zero days has no range to sample from."""
+        targets = [date(2024, 1, 1), date(2024, 1, 1)]
+        assert run_baseline(targets, [date(2024, 1, 1)], 3) == (0.0, 0.0)
+
+
+# ── Tests: import cost ──────────────────────────────────────────────────────
+
+def test_small_inputs_do_not_import_numba():
+    """Importing the module and matching small datasets should not load numba."""
+    code = (
+        "import sys; from datetime import date; "
+        "from src.correlate_anchors import find_matches, run_baseline; "
+        "find_matches([date(2024, 1, 1)], [date(2024, 1, 2)], 3); "
+        "run_baseline([date(2024, 1, 1), date(2024, 2, 1)], [date(2024, 1, 2)], 3); "
+        "sys.exit('numba' in sys.modules)"
+    )
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert subprocess.run([sys.executable, "-c", code], cwd=project_root).returncode == 0
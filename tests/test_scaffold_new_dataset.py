@@ -0,0 +1,45 @@
+"""
+test_scaffold_new_dataset.py - Tests for the dataset scaffolder.
+
+These tests call create_csv() directly (skipping the interactive prompts)
+and check the header row it writes.
+
+Run with:
+    pytest tests/test_scaffold_new_dataset.py -v
+"""
+
+import csv
+import os
+import subprocess
+import sys
+
+from src.scaffold_new_dataset import RECOMMENDED_COLUMNS, REQUIRED_COLUMNS, create_csv
+
+
+class TestCreateCsv:
+    def test_required_and_recommended_headers(self, tmp_path, monkeypatch):
+        """The file should contain exactly one header row with every column."""
+        monkeypatch.chdir(tmp_path)
+        output_path, columns, _ = create_csv("FDA", ["Policy"], True, "fda.csv")
+
+        with open(output_path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+        assert rows == [REQUIRED_COLUMNS + RECOMMENDED_COLUMNS]
+        assert columns == REQUIRED_COLUMNS + RECOMMENDED_COLUMNS
+
+    def test_required_only(self, tmp_path, monkeypatch):
+        """Declining recommended columns should write only the required ones."""
+        monkeypatch.chdir(tmp_path)
+        output_path, _, _ = create_csv("FDA", ["Policy"], False, "fda.csv")
+
+        with open(output_path, newline="", encoding="utf-8") as f:
+            assert f.read() == ",".join(REQUIRED_COLUMNS) + "\n"
+
+    def test_does_not_import_pandas(self):
+        """The scaffolder should start without paying for a pandas import."""
+        code = (
+            "import sys; import src.scaffold_new_dataset; "
+            "sys.exit('pandas' in sys.modules)"
+        )
+        project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        assert subprocess.run([sys.executable, "-c", code], cwd=project_root).returncode == 0
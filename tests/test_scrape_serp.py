@@ -1,19 +1,67 @@
 """
 test_scrape_serp.py - Tests for the SerpApi scraping script.
 
-These tests verify the data-transformation functions (results_to_rows,
-write_csv) without calling the real SerpApi endpoint.
+These tests verify the data-transformation functions (iter_rows,
+results_to_rows, write_csv) and the request handling in search_serpapi
+without calling the real SerpApi endpoint.
 
 Run with:
     pytest tests/test_scrape_serp.py -v
 """
 
 import csv
+import gzip
+import json
 import os
+import subprocess
+import sys
 
 import pytest
 
-from src.scrape_serp import results_to_rows, write_csv
+from src import scrape_serp
+from src.scrape_serp import FIELDS, iter_rows, results_to_rows, search_many, search_serpapi, write_csv
+
+
+# ── Helpers ──────────────────────────────────────────────────────────────────
+
+@pytest.fixture(params=["orjson", "json"])
+def json_backend(request, monkeypatch):
+    """Decode responses with orjson (if installed) and with stdlib json."""
+    if request.param == "orjson":
+        monkeypatch.setattr(scrape_serp, "_json", pytest.importorskip("orjson"))
+    else:
+        monkeypatch.setattr(scrape_serp, "_json", json)
+    return request.param
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """Keep the SerpApi response cache out of the real home directory."""
+    path = tmp_path / "serp-cache"
+    monkeypatch.setattr(scrape_serp, "_CACHE_DIR", path)
+    return path
+
+
+class _FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self.content = json.dumps(payload).encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    """Stands in for requests.Session and records every call."""
+
+    def __init__(self, payload=None, status_code=200):
+        self.payload = payload if payload is not None else {"organic_results": []}
+        self.status_code = status_code
+        self.calls = []
+
+    def get(self, url, params=None, timeout=None):
+        self.calls.append(params)
+        return _FakeResponse(self.payload, self.status_code)
 
 
 # ── Tests: results_to_rows ──────────────────────────────────────────────────
@@ -108,6 +156,35 @@ class TestWriteCsv:
         assert len(loaded) == 1
         assert loaded[0]["entity"] == "TestCorp"
 
+    def test_streams_tuple_rows(self, tmp_path, capsys):
+        """iter_rows output should be written in FIELDS order without a list."""
+        raw = [
+            {"title": f"Article {i}", "link": f"https://example.com/{i}", "snippet": "..."}
+            for i in range(3)
+        ]
+        path = os.path.join(str(tmp_path), "streamed.csv")
+        write_csv(iter_rows(raw, entity="FDA", event_type="Policy", query="q"), path)
+
+        with open(path, newline="", encoding="utf-8") as f:
+            reader = csv.DictReader(f)
+            assert tuple(reader.fieldnames) == FIELDS
+            loaded = list(reader)
+        assert [r["source_url"] for r in loaded] == [f"https://example.com/{i}" for i in range(3)]
+        assert loaded[0]["notes"] == "Auto-collected via SerpApi. Query: q"
+        assert "Saved 3 rows" in capsys.readouterr().out
+
+    def test_gz_path_written_compressed(self, tmp_path):
+        """An output path ending in .gz should produce a gzip-compressed CSV."""
+        raw = [{"title": "A", "link": "https://example.com", "snippet": "..."}]
+        path = os.path.join(str(tmp_path), "out.csv.gz")
+        write_csv(iter_rows(raw, entity="FDA", event_type="Policy"), path)
+
+        with open(path, "rb") as f:
+            assert f.read(2) == b"\x1f\x8b"  # gzip magic number
+        with gzip.open(path, "rt", newline="", encoding="utf-8") as f:
+            loaded = list(csv.DictReader(f))
+        assert loaded[0]["source_url"] == "https://example.com"
+
     def test_empty_rows_no_file(self, tmp_path, capsys):
         """write_csv with empty rows should print a message, not crash."""
         path = os.path.join(str(tmp_path), "empty.csv")
@@ -115,3 +192,114 @@ class TestWriteCsv:
         assert not os.path.exists(path)
         captured = capsys.readouterr()
         assert "No results" in captured.out
+
+
+# ── Tests: search_serpapi ───────────────────────────────────────────────────
+
+@pytest.mark.usefixtures("json_backend")
+class TestSearchSerpapi:
+    def test_uses_injected_session(self):
+        """A caller-supplied session should be used instead of the shared one."""
+        session = _FakeSession({"organic_results": [{"title": "A", "link": "https://a.com"}]})
+        results = search_serpapi("q", "key", num_results=5, session=session)
+        assert results == [{"title": "A", "link": "https://a.com"}]
+        assert session.calls == [{"q": "q", "api_key": "key", "engine": "google", "num": 5}]
+
+    def test_shared_session_by_default(self, monkeypatch):
+        """Without a session argument the module-level keep-alive session is used."""
+        session = _FakeSession()
+        monkeypatch.setattr(scrape_serp, "_SESSION", session)
+        assert search_serpapi("q", "key") == []
+        assert len(session.calls) == 1
+
+    def test_invalid_key_exits(self):
+        """A 401 from SerpApi should exit with code 1."""
+        with pytest.raises(SystemExit) as exc:
+            search_serpapi("q", "bad", session=_FakeSession(status_code=401))
+        assert exc.value.code == 1
+
+
+# ── Tests: search_many ──────────────────────────────────────────────────────
+
+class TestSearchMany:
+    def test_yields_every_query_once(self):
+        """Each query should be searched once and paired with its results."""
+        session = _FakeSession({"organic_results": [{"link": "https://a.com"}]})
+        queries = [f"query {i}" for i in range(5)]
+        pairs = list(search_many(queries, "key", workers=3, session=session))
+        assert sorted(q for q, _ in pairs) == queries
+        assert all(results == [{"link": "https://a.com"}] for _, results in pairs)
+        assert sorted(call["q"] for call in session.calls) == queries
+
+    def test_no_queries(self):
+        """An empty query list should yield nothing and make no requests."""
+        session = _FakeSession()
+        assert list(search_many([], "key", session=session)) == []
+        assert session.calls == []
+
+    def test_errors_propagate(self):
+        """A failing search (e.g. a bad key) should surface to the caller."""
+        with pytest.raises(SystemExit):
+            list(search_many(["a", "b"], "bad", session=_FakeSession(status_code=401)))
+
+    def test_shared_pool_fits_every_worker(self):
+        """The shared session should keep a pooled connection for each worker."""
+        adapter = scrape_serp._SESSION.get_adapter("https://serpapi.com/search")
+        assert adapter._pool_maxsize >= scrape_serp.SEARCH_WORKERS
+
+
+# ── Tests: response cache ───────────────────────────────────────────────────
+
+@pytest.mark.usefixtures("json_backend")
+class TestCache:
+    def test_repeat_query_served_from_cache(self, cache_dir):
+        """A second identical search should not hit the network."""
+        session = _FakeSession({"organic_results": [{"link": "https://a.com"}]})
+        first = search_serpapi("q", "key", session=session)
+        second = search_serpapi("q", "other-key", session=session)
+        assert first == second == [{"link": "https://a.com"}]
+        assert len(session.calls) == 1
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_different_num_results_not_shared(self):
+        """num_results is part of the cache key."""
+        session = _FakeSession()
+        search_serpapi("q", "key", num_results=10, session=session)
+        search_serpapi("q", "key", num_results=20, session=session)
+        assert len(session.calls) == 2
+
+    def test_expired_entry_refetched(self, cache_dir):
+        """Entries older than the TTL should be fetched again."""
+        session = _FakeSession()
+        search_serpapi("q", "key", session=session)
+        for path in cache_dir.glob("*.json"):
+            os.utime(path, (0, 0))
+        search_serpapi("q", "key", session=session)
+        assert len(session.calls) == 2
+
+    def test_cache_disabled(self, cache_dir):
+        """cache_ttl=0 should neither read nor write the cache."""
+        session = _FakeSession()
+        search_serpapi("q", "key", session=session, cache_ttl=0)
+        search_serpapi("q", "key", session=session, cache_ttl=0)
+        assert len(session.calls) == 2
+        assert not cache_dir.exists()
+
+    def test_failed_request_not_cached(self, cache_dir):
+        """Errors such as a bad key must not leave a cache entry behind."""
+        with pytest.raises(SystemExit):
+            search_serpapi("q", "bad", session=_FakeSession(status_code=401))
+        assert not cache_dir.exists()
+
+
+# ── Tests: import cost ──────────────────────────────────────────────────────
+
+def test_import_does_not_load_settings():
+    """Settings and logging should be set up on first use, not at import."""
+    code = (
+        "import sys; import src.scrape_serp; "
+        "from src.config_loader import _parse_yaml; "
+        "sys.exit(_parse_yaml.cache_info().currsize)"
+    )
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    assert subprocess.run([sys.executable, "-c", code], cwd=project_root).returncode == 0
@@ -8,9 +8,13 @@ Each test intentionally feeds "dirty" data to the validator and asserts
 that the correct issue is detected. If all tests pass, the pipeline works.
 """
 
+import json
 import os
+import random
 import tempfile
+import time
 from datetime import datetime, timedelta
+from urllib.parse import urlparse
 
 import pandas as pd
 import pytest
@@ -24,10 +28,13 @@ from src.validate_dataset import (
     check_missing_source_urls,
     check_required_columns,
     check_verification_status,
+    load_and_validate_streaming,
     load_csv,
+    print_report,
     run_all_checks,
 )
-from src.config_loader import load_settings
+from src import validate_dataset
+from src.config_loader import _load_dotenv, get_logger, load_settings
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -72,6 +79,91 @@ class TestConfigLoads:
         assert "entity" in required
         assert "source_url" in required
 
+    def test_streaming_thresholds_from_config(self):
+        """The streaming cut-over and chunk size should come from settings.yaml."""
+        validation = load_settings()["validation"]
+        assert validate_dataset.STREAM_MIN_BYTES == validation["stream_min_mb"] * 1024 * 1024
+        assert validate_dataset.CHUNK_ROWS == validation["chunk_rows"]
+
+    def test_settings_are_independent_copies(self):
+        """Mutating one loaded settings dict should not leak into the next load."""
+        settings = load_settings()
+        settings["schema"]["required_columns"].append("bogus")
+        assert "bogus" not in load_settings()["schema"]["required_columns"]
+
+    def test_settings_reload_after_edit(self, tmp_path):
+        """Editing the YAML file should invalidate the parsed-settings cache."""
+        path = tmp_path / "settings.yaml"
+        path.write_text("logging:\n  level: INFO\n")
+        assert "extra" not in load_settings(path)
+        path.write_text("logging:\n  level: INFO\nextra: 1\n")
+        assert load_settings(path)["extra"] == 1
+
+    def test_json_sidecar_written_and_reused(self, tmp_path):
+        """The first parse should leave a JSON sidecar that matches the YAML."""
+        path = tmp_path / "settings.yaml"
+        path.write_text("schema:\n  required_columns: [date, entity]\nlogging: {}\n")
+        settings = load_settings(path)
+        sidecar = tmp_path / ".settings.yaml.json"
+        assert sidecar.exists()
+        assert json.loads(sidecar.read_text())["settings"] == settings
+
+    def test_dotenv_cached_and_reloaded(self, tmp_path, monkeypatch):
+        """.env values are re-applied from cache and re-read after an edit."""
+        env_path = tmp_path / ".env"
+        env_path.write_text("OSINT_TEST_A=one\n# comment\nOSINT_TEST_EMPTY=\n")
+        monkeypatch.delenv("OSINT_TEST_A", raising=False)
+        monkeypatch.delenv("OSINT_TEST_B", raising=False)
+        monkeypatch.delenv("OSINT_TEST_EMPTY", raising=False)
+
+        _load_dotenv(env_path)
+        assert os.environ["OSINT_TEST_A"] == "one"
+        assert "OSINT_TEST_EMPTY" not in os.environ
+
+        # Unchanged file: values come back from the cache.
+        monkeypatch.delenv("OSINT_TEST_A")
+        _load_dotenv(env_path)
+        assert os.environ["OSINT_TEST_A"] == "one"
+
+        # Edited file: new variables are picked up.
+        env_path.write_text("OSINT_TEST_A=one\nOSINT_TEST_B=two\n")
+        _load_dotenv(env_path)
+        assert os.environ["OSINT_TEST_B"] == "two"
+
+
+# ── Tests: Logging ──────────────────────────────────────────────────────────
+
+class TestLogging:
+    def test_file_log_written_in_background(self, tmp_path):
+        """Records should reach the log file via the background listener."""
+        settings = load_settings()
+        settings["logging"]["log_dir"] = str(tmp_path)
+        settings["logging"]["log_to_console"] = False
+        logger = get_logger("test_background_logging", settings)
+
+        logger.error("disk write happens off the hot path")
+
+        log_file = tmp_path / "test_background_logging.log"
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if log_file.exists() and "off the hot path" in log_file.read_text():
+                break
+            time.sleep(0.01)
+        assert "off the hot path" in log_file.read_text()
+
+    def test_format_can_use_process_and_thread_fields(self, capsys):
+        """logging.format in settings.yaml may reference process/thread fields."""
+        settings = load_settings()
+        settings["logging"]["format"] = "%(process)d %(threadName)s %(message)s"
+        settings["logging"]["log_to_file"] = False
+        logger = get_logger("test_process_thread_format", settings)
+
+        logger.warning("with process fields")
+
+        err = capsys.readouterr().err
+        assert f"{os.getpid()} MainThread with process fields" in err
+        assert "Logging error" not in err
+
 
 # ── Tests: Clean data passes ─────────────────────────────────────────────────
 
@@ -102,6 +194,32 @@ class TestMissingColumns:
         assert len(issues) == 1
         assert "source_url" in issues[0]["message"]
 
+    def test_missing_columns_listed_in_schema_order(self):
+        """Several missing columns should be named in REQUIRED_COLUMNS order."""
+        df = _make_df().drop(columns=["verification_status", "date"])
+        issues = check_required_columns(df)
+        assert issues[0]["message"] == "Missing required columns: date, verification_status"
+
+    def test_missing_columns_skip_row_checks(self):
+        """run_all_checks should stop at the CRITICAL issue, not pile on row errors."""
+        df = _make_df({"date": ["bad", "worse", "2099-01-01"]})
+        df = df.drop(columns=["entity"])
+        issues = run_all_checks(df)
+        assert [i["check"] for i in issues] == ["required_columns"]
+
+    def test_header_only_file_has_no_issues(self):
+        """A file with all columns but no rows has nothing to flag."""
+        df = _make_df(n_rows=0)
+        assert run_all_checks(df) == []
+
+    def test_header_only_file_skips_row_checks(self, monkeypatch):
+        """run_all_checks should return before running any row check."""
+        def fail(df, ctx):
+            raise AssertionError("row check ran on an empty frame")
+
+        monkeypatch.setattr(validate_dataset, "ROW_CHECKS", (fail,))
+        assert run_all_checks(_make_df(n_rows=0)) == []
+
 
 # ── Tests: Date format ──────────────────────────────────────────────────────
 
@@ -127,6 +245,57 @@ class TestDateFormat:
         issues = check_date_format(df)
         assert len(issues) == 0
 
+    def test_padding_empty_and_impossible_dates(self):
+        """Whitespace is stripped, empties are skipped, impossible dates are flagged."""
+        df = _make_df({"date": [" 2024-01-15 ", None, "2024-02-30"]})
+        issues = check_date_format(df)
+        assert len(issues) == 1
+        assert list(issues[0]["rows"]) == [2]
+
+    def test_matches_strptime(self):
+        """The vectorized parse should accept exactly what strptime accepts."""
+        values = [
+            "2024-01-15", "2024-1-5", "20240115", "2024-01-15T10:00",
+            "2024-01-15 10:00:00", "2023-02-29", "2024-02-29", "15-01-2024",
+        ]
+        expected = []
+        for i, value in enumerate(values):
+            try:
+                datetime.strptime(value, "%Y-%m-%d")
+            except ValueError:
+                expected.append(i)
+        df = pd.DataFrame({"date": values})
+        issues = check_date_format(df)
+        assert issues[0]["rows"] == expected
+
+
+class TestDateKernel:
+    """The optional Numba date scanner must agree with pd.to_datetime."""
+
+    @pytest.fixture(autouse=True)
+    def use_kernel(self, monkeypatch):
+        pytest.importorskip("numba")
+        monkeypatch.setattr(validate_dataset, "DATE_KERNEL_MIN_ROWS", 0)
+
+    def test_matches_pandas(self):
+        """Valid, invalid and undecided strings all parse like pd.to_datetime."""
+        values = [
+            "2024-01-15", "2024-1-5", "2024-01- 5", "2024- 1-05", "2000-02-29", "2100-02-29",
+            "0001-01-01", "9999-12-31", "0000-01-01", "-2024-01-05", "\uff12\uff10\uff12\uff14-01-01",
+            "20240115", "2024-01-15T10:00", "2024/01/15", "2024-13-01", "2024-00-10", "", "bad",
+        ]
+        rng = random.Random(0)
+        values += ["".join(rng.choice("0123-") for _ in range(rng.randint(0, 11))) for _ in range(2000)]
+        stripped = pd.Series(values, dtype="string")
+        expected = pd.to_datetime(stripped, format="%Y-%m-%d", errors="coerce")
+        pd.testing.assert_series_equal(validate_dataset._parse_dates(stripped), expected)
+
+    def test_checks_use_kernel_results(self):
+        """check_date_format and check_future_dates work on kernel output."""
+        df = _make_df({"date": [" 2024-01-15 ", "2024-02-30", "2999-01-01"]})
+        assert check_date_format(df)[0]["rows"] == [1]
+        assert check_future_dates(df)[0]["rows"] == [2]
+
 
 # ── Tests: Future dates ─────────────────────────────────────────────────────
 
@@ -147,6 +316,17 @@ class TestFutureDates:
         issues = check_future_dates(df)
         assert len(issues) == 0
 
+    def test_today_is_not_future(self):
+        """Only dates strictly after today are flagged."""
+        today = validate_dataset._TODAY
+        df = _make_df({"date": [
+            today.strftime("%Y-%m-%d"),
+            (today - pd.Timedelta(days=1)).strftime("%Y-%m-%d"),
+            (today + pd.Timedelta(days=1)).strftime("%Y-%m-%d"),
+        ]})
+        issues = check_future_dates(df)
+        assert issues[0]["rows"] == [2]
+
 
 # ── Tests: Missing source URLs ──────────────────────────────────────────────
 
@@ -165,6 +345,14 @@ class TestMissingSourceUrls:
         assert len(issues) == 1
         assert len(issues[0]["rows"]) == 1
 
+    @pytest.mark.parametrize("arrow_strings", [True, False])
+    def test_any_whitespace_counts_as_missing(self, monkeypatch, arrow_strings):
+        """Tabs and newlines are blank too, on both strip paths."""
+        monkeypatch.setattr(validate_dataset, "_ARROW_STRINGS", arrow_strings)
+        df = _make_df({"source_url": ["\t", " \n ", "https://example.com"]}).astype(object)
+        issues = check_missing_source_urls(df)
+        assert issues[0]["rows"] == [0, 1]
+
 
 # ── Tests: Invalid URLs ─────────────────────────────────────────────────────
 
@@ -186,6 +374,18 @@ class TestInvalidUrls:
         issues = check_invalid_urls(df)
         assert len(issues) == 0
 
+    def test_matches_urlparse(self):
+        """The regex should agree with urlparse's scheme + netloc test."""
+        urls = [
+            "HTTP://X.COM", "s3://bucket/key", "http://[::1]/", "http://x y", "http:// x",
+            "mailto:x@y.com", "http://", "https://?q=1", "https://#frag", "//example.com",
+            "1http://x", "file:///etc/passwd", "javascript:alert(1)",
+        ]
+        expected = [i for i, url in enumerate(urls) if not (urlparse(url).scheme and urlparse(url).netloc)]
+        df = pd.DataFrame({"source_url": urls})
+        issues = check_invalid_urls(df)
+        assert issues[0]["rows"] == expected
+
 
 # ── Tests: Empty required fields ────────────────────────────────────────────
 
@@ -202,6 +402,23 @@ class TestEmptyFields:
         issues = check_empty_required_fields(df)
         assert len(issues) == 0
 
+    def test_one_issue_per_column_in_schema_order(self):
+        """Each required column gets its own issue, in required_columns order."""
+        df = _make_df({
+            "verification_status": ["", "Verified", None],
+            "entity": ["A", " ", "C"],
+            "date": [None, "2024-01-16", ""],
+        })
+        issues = check_empty_required_fields(df)
+        by_check = {i["check"]: i["rows"] for i in issues}
+        assert by_check == {
+            "empty_date": [0, 2],
+            "empty_entity": [1],
+            "empty_verification_status": [0, 2],
+        }
+        order = [c for c in validate_dataset.REQUIRED_COLUMNS if f"empty_{c}" in by_check]
+        assert [i["check"] for i in issues] == [f"empty_{c}" for c in order]
+
 
 # ── Tests: Verification status ──────────────────────────────────────────────
 
@@ -219,6 +436,16 @@ class TestVerificationStatus:
         issues = check_verification_status(df)
         assert len(issues) == 0
 
+    def test_bad_values_reported_once_each(self):
+        """Repeated bad values are counted per row but listed once."""
+        df = _make_df({"verification_status": ["Maybe", " Maybe ", "Verified", "Nope"]}, n_rows=4)
+        issues = check_verification_status(df)
+        assert issues[0]["rows"] == [0, 1, 3]
+        assert issues[0]["values"] == ["Maybe", "Nope"]
+        assert issues[0]["message"].startswith("3 row(s)")
+        assert issues[0]["message"].endswith("Found: ['Maybe', 'Nope']")
+        json.dumps(issues)  # Issue dicts hold only plain JSON types.
+
 
 # ── Tests: Duplicates ───────────────────────────────────────────────────────
 
@@ -231,6 +458,29 @@ class TestDuplicates:
         assert len(issues) == 1
         assert len(issues[0]["rows"]) == 2  # 2 duplicates (first kept)
 
+    def test_duplicates_ignore_non_required_columns(self):
+        """Rows that differ only in free-text columns are still duplicates."""
+        df = _make_df(n_rows=1)
+        df = pd.concat([df, df], ignore_index=True)
+        df["notes"] = ["first copy", "second copy"]
+        issues = check_duplicates(df)
+        assert len(issues) == 1
+        assert list(issues[0]["rows"]) == [1]
+
+    def test_rows_are_positions_not_index_labels(self):
+        """Flagged rows are 0-based positions even if the index is not."""
+        df = _make_df(n_rows=1)
+        df = pd.concat([df, df], ignore_index=True)
+        df.index = [10, 20]
+        issues = check_duplicates(df)
+        assert issues[0]["rows"] == [1]
+
+    def test_missing_values_match_each_other(self):
+        """Rows that are both missing the same field still count as duplicates."""
+        df = _make_df({"entity": [None, None, "C"], "date": ["2024-01-15"] * 3})
+        issues = check_duplicates(df)
+        assert issues[0]["rows"] == [1]
+
     def test_unique_rows_pass(self):
         """Distinct rows should not be flagged."""
         df = _make_df({"entity": ["A", "B", "C"]})
@@ -267,6 +517,160 @@ class TestFullPipeline:
         assert len(loaded) == 3
         assert "date" in loaded.columns
 
+    def test_context_for_other_frame_rejected(self):
+        """A CheckContext only applies to the DataFrame it was built for."""
+        ctx = validate_dataset.CheckContext(_make_df())
+        with pytest.raises(ValueError):
+            check_missing_source_urls(_make_df(), ctx)
+
+    def test_dates_parsed_once(self, monkeypatch):
+        """The date_format and future_dates checks should share one parse."""
+        calls = []
+        to_datetime = pd.to_datetime
+
+        def counting_to_datetime(*args, **kwargs):
+            calls.append(args)
+            return to_datetime(*args, **kwargs)
+
+        monkeypatch.setattr(pd, "to_datetime", counting_to_datetime)
+        df = _make_df({"date": ["bad", "2099-01-01", "2024-01-15"]})
+        checks = {i["check"] for i in run_all_checks(df)}
+        assert {"date_format", "future_dates"} <= checks
+        assert len(calls) == 1
+
+    def test_each_column_stripped_once(self, monkeypatch):
+        """run_all_checks should share one stripped copy of each column."""
+        calls = []
+        strip = validate_dataset._strip
+
+        def counting_strip(col):
+            calls.append(col.name)
+            return strip(col)
+
+        monkeypatch.setattr(validate_dataset, "_strip", counting_strip)
+        df = _make_df({"source_url": ["https://a.com", "", "nope"]})
+        assert run_all_checks(df)
+        assert sorted(calls) == sorted(validate_dataset.REQUIRED_COLUMNS)
+
+    def test_parallel_matches_serial(self, monkeypatch):
+        """The thread-pool path should return the same issues in the same order."""
+        df = pd.DataFrame({
+            "date": ["not-a-date", "2099-12-31", "", "2024-01-15"] * 5,
+            "entity": ["", "Test", "", "Corp"] * 5,
+            "event_type": ["Policy", "", "Legal", "Policy"] * 5,
+            "source_url": ["not_a_url", "", "https://good.com", "https://a.com"] * 5,
+            "verification_status": ["WRONG", "Verified", "", "Verified"] * 5,
+        })
+        serial = run_all_checks(df)
+        monkeypatch.setattr(validate_dataset, "PARALLEL_MIN_ROWS", 0)
+        monkeypatch.setattr(validate_dataset, "CHECK_WORKERS", 4)
+        assert run_all_checks(df) == serial
+
+    def test_single_worker_runs_serially(self, monkeypatch):
+        """With one worker, run_all_checks should not start a thread pool."""
+        monkeypatch.setattr(validate_dataset, "PARALLEL_MIN_ROWS", 0)
+        monkeypatch.setattr(validate_dataset, "CHECK_WORKERS", 1)
+        monkeypatch.setattr(validate_dataset, "ThreadPoolExecutor", None)
+        assert run_all_checks(_make_df()) == []
+
+    @pytest.mark.parametrize("arrow_strings", [True, False])
+    def test_object_columns_strip_paths_agree(self, monkeypatch, arrow_strings):
+        """The list-comprehension strip path should flag the same rows."""
+        monkeypatch.setattr(validate_dataset, "_ARROW_STRINGS", arrow_strings)
+        df = pd.DataFrame({
+            "date": [" 2024-01-15 ", None, "bad", float("nan")],
+            "entity": ["Corp", "   ", None, 42],
+            "event_type": ["Policy"] * 4,
+            "source_url": [" https://a.com ", "", "nope", None],
+            "verification_status": ["Verified", "Maybe", " Verified ", None],
+        }, dtype=object)
+        by_check = {i["check"]: i["rows"] for i in run_all_checks(df)}
+        assert by_check == {
+            "date_format": [2],
+            "missing_source_url": [1, 3],
+            "invalid_urls": [2],
+            "empty_date": [1, 3],
+            "empty_entity": [1, 2],
+            "empty_source_url": [1, 3],
+            "empty_verification_status": [3],
+            "verification_status": [1],
+        }
+
+    @pytest.mark.parametrize("dtype", ["string", "string[pyarrow]", "large_string[pyarrow]"])
+    def test_string_dtypes_match_object(self, dtype):
+        """pd.NA in string columns should be flagged like None in object ones."""
+        if "pyarrow" in dtype:
+            pytest.importorskip("pyarrow")
+        data = {
+            "date": [" 2024-01-15 ", None, "bad", "2024-02-01"],
+            "entity": ["Corp", "   ", None, "Gov"],
+            "event_type": ["Policy"] * 4,
+            "source_url": [" https://a.com ", "", "nope", None],
+            "verification_status": ["Verified", "Maybe", " Verified ", None],
+        }
+        expected = run_all_checks(pd.DataFrame(data, dtype=object))
+        assert expected
+        assert run_all_checks(pd.DataFrame(data, dtype=dtype)) == expected
+
+    @pytest.mark.parametrize("engine", ["pyarrow", "c"])
+    def test_load_csv_engines_agree(self, tmp_path, monkeypatch, engine):
+        """Both CSV parsers should surface the same issues for a dirty, ragged file."""
+        if engine == "pyarrow":
+            pytest.importorskip("pyarrow")
+        else:
+            read_csv = pd.read_csv
+
+            def no_pyarrow(*args, **kwargs):
+                if kwargs.get("engine") == "pyarrow":
+                    raise ImportError("pyarrow is not installed")
+                return read_csv(*args, **kwargs)
+
+            monkeypatch.setattr(pd, "read_csv", no_pyarrow)
+        path = tmp_path / "dirty.csv"
+        path.write_text(
+            "date,entity,event_type,source_url,verification_status\n"
+            "2024-01-15,Corp,Policy,,Verified\n"
+            "01/15/2024, ,Policy,https://example.com,Maybe\n"
+            "2024-01-16,Corp,Policy\n"
+        )
+        loaded = load_csv(str(path))
+        assert loaded["source_url"].isna().tolist() == [True, False, True]
+        check_names = {i["check"] for i in run_all_checks(loaded)}
+        assert check_names == {
+            "date_format", "missing_source_url", "empty_source_url",
+            "empty_entity", "verification_status", "empty_verification_status",
+        }
+
+    def test_load_checked_columns_only(self, tmp_path):
+        """full=False should drop unchecked columns but find the same issues."""
+        df = _make_df({"source_url": ["https://a.com", "", "https://b.com"]})
+        df["notes"] = ["x", "y", "z"]
+        path = _write_csv(df, tmp_path)
+        loaded = load_csv(path, full=False)
+        assert list(loaded.columns) == list(_make_df().columns)
+        assert loaded.attrs["n_columns"] == 6
+        assert run_all_checks(loaded) == run_all_checks(load_csv(path))
+
+    def test_load_checked_columns_missing_required(self, tmp_path):
+        """Without every required column, full=False should read the whole file."""
+        path = tmp_path / "partial.csv"
+        path.write_text("date,notes\n2024-01-15,x\n")
+        loaded = load_csv(str(path), full=False)
+        assert list(loaded.columns) == ["date", "notes"]
+        assert [i["check"] for i in run_all_checks(loaded)] == ["required_columns"]
+
+    def test_load_gzipped_csv(self, tmp_path):
+        """A .csv.gz file should be decompressed transparently."""
+        df = _make_df({"source_url": ["https://a.com", "", "https://b.com"]})
+        path = os.path.join(str(tmp_path), "test_data.csv.gz")
+        df.to_csv(path, index=False)
+        loaded = load_csv(path)
+        assert len(loaded) == 3
+        assert [i["check"] for i in run_all_checks(loaded)] == ["missing_source_url", "empty_source_url"]
+        issues, n_rows, _ = load_and_validate_streaming(path, chunksize=2)
+        assert n_rows == 3
+        assert issues == run_all_checks(loaded)
+
     def test_real_example_dataset(self):
         """The reference Holidays dataset should trigger known issues (missing columns)."""
         holidays_path = os.path.join("My_Datasets_as_Examples", "Holidays_2015_2025_Verified.csv")
@@ -278,3 +682,82 @@ class TestFullPipeline:
         critical = [i for i in issues if i["severity"] == "CRITICAL"]
         assert len(critical) >= 1
         assert "Missing required columns" in critical[0]["message"]
+
+
+# ── Tests: Streaming validation ─────────────────────────────────────────────
+
+class TestStreaming:
+    @pytest.mark.parametrize("chunksize", [1, 3, 100])
+    def test_matches_whole_file_validation(self, tmp_path, chunksize):
+        """Chunked validation should report exactly what run_all_checks does."""
+        df = pd.DataFrame({
+            "date": ["2024-01-15", "bad", "2099-12-31", "", "2024-01-15", "2024-02-01", "2024-01-15"],
+            "entity": ["Corp", "", "Corp", "Corp", "Corp", "", "Corp"],
+            "event_type": ["Policy"] * 7,
+            "source_url": ["https://a.com", "nope", "", "https://b.com", "https://a.com", "x", "https://a.com"],
+            "verification_status": ["Verified", "Maybe", "Verified", "", "Verified", "Nope", "Verified"],
+        })
+        path = _write_csv(df, tmp_path)
+        expected = run_all_checks(load_csv(path))
+
+        issues, n_rows, columns = load_and_validate_streaming(path, chunksize=chunksize)
+
+        assert n_rows == 7
+        assert columns == list(df.columns)
+        assert issues == expected
+        duplicates = [i for i in issues if i["check"] == "duplicates"]
+        assert duplicates[0]["rows"] == [4, 6]  # Both repeat row 0, across chunks.
+
+    def test_hashed_duplicates_match_check_duplicates(self, tmp_path):
+        """Cross-chunk hashing should flag exactly the rows duplicated() does."""
+        rng = random.Random(3)
+        df = _make_df({
+            "date": [rng.choice(["2024-01-15", "2024-01-16", None]) for _ in range(300)],
+            "entity": [rng.choice(["A", "B", "C", None]) for _ in range(300)],
+            "event_type": [rng.choice(["Policy", "Legal"]) for _ in range(300)],
+            "source_url": ["https://a.com"] * 300,
+            "verification_status": ["Verified"] * 300,
+        }, n_rows=300)
+        path = _write_csv(df, tmp_path)
+        expected = check_duplicates(load_csv(path))[0]["rows"]
+        issues, _, _ = load_and_validate_streaming(path, chunksize=7)
+        assert [i["rows"] for i in issues if i["check"] == "duplicates"] == [expected]
+
+    def test_missing_columns_stop_early(self, tmp_path):
+        """A file without the required columns gets only the CRITICAL issue."""
+        path = tmp_path / "partial.csv"
+        path.write_text("date,title\n2024-01-15,a\nbad,b\n")
+        issues, n_rows, columns = load_and_validate_streaming(str(path), chunksize=1)
+        assert [i["severity"] for i in issues] == ["CRITICAL"]
+        assert n_rows == 2
+        assert columns == ["date", "title"]
+
+    def test_missing_file_exits(self, tmp_path):
+        """A nonexistent file should exit with code 2, like load_csv."""
+        with pytest.raises(SystemExit) as exc:
+            load_and_validate_streaming(str(tmp_path / "missing.csv"))
+        assert exc.value.code == 2
+
+
+# ── Tests: Report ───────────────────────────────────────────────────────────
+
+class TestPrintReport:
+    def test_summary_counts_each_row_once(self, capsys):
+        """A row flagged by several checks counts once in the summary."""
+        df = _make_df({
+            "entity": ["", "B", "C"],
+            "source_url": ["", "https://b.com", "https://c.com"],
+        })
+        exit_code = print_report("test.csv", df, run_all_checks(df))
+        out = capsys.readouterr().out
+        assert "Summary: 1/3 rows (33.3%) have issues." in out
+        assert "Rows: 2" in out  # Row 0 shown as line 2 of the file.
+        assert exit_code == 1  # 33% is over the 20% threshold.
+
+    def test_missing_columns_skip_row_summary(self, capsys):
+        """With required columns missing, the summary says row checks were skipped."""
+        df = pd.DataFrame({"random_col": ["a", "b"]})
+        assert print_report("test.csv", df, run_all_checks(df)) == 1
+        out = capsys.readouterr().out
+        assert "Summary: Row-level checks skipped (required columns are missing)." in out
+        assert "0/2 rows" not in out